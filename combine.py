@@ -2,16 +2,24 @@ import os
 import sys
 import re
 import json
+import atexit
+import shutil
 import logging
+import tempfile
+import unicodedata
+import subprocess
 from datetime import datetime
-from collections import defaultdict
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from concurrent.futures import ThreadPoolExecutor
 from tqdm import tqdm
 
 # Only works well on Windows for arrow keys; remove or adapt if on another platform.
 import msvcrt
 
-from moviepy.editor import concatenate_audioclips, AudioFileClip
+# moviepy.editor is only needed by the re-encoding fallback and pulls in numpy,
+# imageio and friends, so it is imported on first use instead of at startup
 
 # ANSI Escape Code Definitions for Coloring
 RESET = "\033[0m"
@@ -25,6 +33,20 @@ MAGENTA = "\033[35m"
 CYAN = "\033[36m"
 WHITE = "\033[37m"
 BG_BLUE = "\033[44m"
+CLEAR_SCREEN = "\033[H\033[2J"  # Cursor home, then erase the display
+
+# Fixed pieces of the selection screen, formatted once instead of per redraw
+CHECKBOX_MERGED = f"{MAGENTA}[*]{RESET}"
+CHECKBOX_SELECTED = f"{GREEN}[x]{RESET}"
+CHECKBOX_UNSELECTED = f"{RED}[ ]{RESET}"
+SELECTION_TITLE = "Select files to merge (Use ↑↓ to navigate, Space to select/deselect, Enter to confirm):"
+SELECTION_HEADER = f"\n{BOLD}{BLUE}{SELECTION_TITLE}{RESET}\n"
+SELECTION_KEYS_HELP = f"\nPress '{RED}q{RESET}' to quit, '{GREEN}a{RESET}' to select all non-merged, '{RED}d{RESET}' to deselect all\n"
+# Screen layout of the selection list: a blank line, the title and another
+# blank line come before the first file row; a blank line, the count, a
+# blank line, the key help and the final cursor line come after the last
+FIRST_FILE_ROW = 4
+SELECTION_SCREEN_EXTRA_LINES = 8
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s', datefmt='%H:%M:%S')
@@ -43,10 +65,29 @@ def load_config():
 config = load_config()
 
 # Configuration Defaults
-DATE_TIME_REGEX = config.get("date_time_regex", r'(\d{4}-\d{2}-\d{2}) (\d{2}-\d{2}(-\d{2})?)')
+# (?a) limits \d to ASCII digits, which skips the Unicode digit lookup per character
+DATE_TIME_REGEX = config.get("date_time_regex", r'(?a)(\d{4}-\d{2}-\d{2}) (\d{2}-\d{2}(?:-\d{2})?)')
 DEFAULT_DATE_FORMAT = config.get("default_date_format", "%Y-%m-%d")
 DEFAULT_TIME_FORMAT = config.get("default_time_format", "%H-%M-%S")
 OUTPUT_DIR = config.get("default_output_dir", None)  # None means current directory
+FFMPEG_PATH = config.get("ffmpeg_path", "ffmpeg")
+FFPROBE_PATH = config.get("ffprobe_path", "ffprobe")
+# How many input files are read at once when probing or loading clips;
+# raise it in config.json for fast SSDs
+IO_WORKERS = config.get("io_workers", max(1, (os.cpu_count() or 2) // 2))
+
+# With the stock pattern and formats every match has fixed field offsets,
+# so it can be sliced directly instead of going through strptime
+FIXED_OFFSET_PARSE = ("date_time_regex" not in config
+                      and DEFAULT_DATE_FORMAT == "%Y-%m-%d"
+                      and DEFAULT_TIME_FORMAT == "%H-%M-%S")
+
+# The stream-copy merge needs both ffmpeg and ffprobe; otherwise fall back to MoviePy
+FFMPEG_AVAILABLE = shutil.which(FFMPEG_PATH) is not None and shutil.which(FFPROBE_PATH) is not None
+
+# Optional JSON file that keeps ffprobe results between runs, so unchanged
+# files are not probed again; None disables it
+PROBE_CACHE_FILE = config.get("probe_cache_file", None)
 
 directory = os.getcwd()  # Current directory
 if OUTPUT_DIR and not os.path.exists(OUTPUT_DIR):
@@ -55,13 +96,48 @@ if OUTPUT_DIR and not os.path.exists(OUTPUT_DIR):
 # Compile the date time pattern
 date_time_pattern = re.compile(DATE_TIME_REGEX)
 
-# List comprehension to get all mp3 files
-mp3_files = [f for f in os.listdir(directory) if f.endswith('.mp3')]
+# List comprehension to get all mp3 files, skipping any directory whose
+# name happens to end in .mp3
+with os.scandir(directory) as entries:
+    mp3_files = [e.name for e in entries if e.name.endswith('.mp3') and e.is_file()]
 
+def slice_date_and_time(date_str, time_str):
+    """Parse 'YYYY-MM-DD' and 'HH-MM[-SS]' strings by their fixed offsets.
+       Raises ValueError for out-of-range fields, like strptime does.
+    """
+    seconds = int(time_str[6:8]) if len(time_str) == 8 else 0
+    timestamp = datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]),
+                         int(time_str[0:2]), int(time_str[3:5]), seconds)
+    return timestamp.date(), timestamp.time()
+
+def leading_date_and_time(filename):
+    """Return the (date_str, time_str) the stock pattern finds when the name
+       starts with 'YYYY-MM-DD HH-MM[-SS]', or None if it does not.
+    """
+    head = filename[:19]
+    if (len(head) >= 16 and head.isascii()
+            and head[4] == head[7] == head[13] == '-' and head[10] == ' '
+            and (head[0:4] + head[5:7] + head[8:10] + head[11:13] + head[14:16]).isdigit()):
+        if len(head) == 19 and head[16] == '-' and head[17:19].isdigit():
+            return head[:10], head[11:19]
+        return head[:10], head[11:16]
+    return None
+
+@lru_cache(maxsize=None)
 def parse_date_and_time_from_filename(filename):
-    match = date_time_pattern.search(filename)
-    if match:
-        date_str, time_str = match.groups()[:2]
+    # Recorder names usually start with the timestamp; check those by position
+    # before falling back to the regex search
+    fields = leading_date_and_time(filename) if FIXED_OFFSET_PARSE else None
+    if fields is None:
+        match = date_time_pattern.search(filename)
+        fields = match.groups()[:2] if match else None
+    if fields:
+        date_str, time_str = fields
+        if FIXED_OFFSET_PARSE:
+            try:
+                return slice_date_and_time(date_str, time_str)
+            except ValueError:
+                return None, None
         try:
             date = datetime.strptime(date_str, DEFAULT_DATE_FORMAT).date()
         except ValueError:
@@ -79,45 +155,81 @@ def parse_date_and_time_from_filename(filename):
     else:
         return None, None
 
-def parse_time_from_filename(filename):
-    date, time = parse_date_and_time_from_filename(filename)
-    if date and time:
-        return datetime.combine(date, time)
-    return datetime.min  # fallback to a minimal datetime if parsing fails
-
 def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    sys.stdout.write(CLEAR_SCREEN)
+    sys.stdout.flush()
 
-def print_file_list(files, selected_files, merged_files, current_index):
-    """Print the file list with checkboxes and highlight the current selection.
+def render_file_row_variants(file):
+    """Render every unhighlighted form of one row of the file list:
+       (unselected, selected, merged).
        Already merged files appear in MAGENTA and cannot be selected again.
     """
-    clear_screen()
-    # Instructions in bold blue
-    print(f"\n{BOLD}{BLUE}Select files to merge (Use ↑↓ to navigate, Space to select/deselect, Enter to confirm):{RESET}\n")
-    for i, file in enumerate(files):
-        # Determine checkbox state and color
-        if file in merged_files:
-            # Already merged files - show as [*] in MAGENTA
-            checkbox = f"{MAGENTA}[*]{RESET}"
-            file_color = MAGENTA
-        else:
-            # Regular files
-            checkbox = f"{GREEN}[x]{RESET}" if file in selected_files else f"{RED}[ ]{RESET}"
-            file_color = WHITE
-        
-        line_str = f"{checkbox} {file_color}{file}{RESET}"
-
-        if i == current_index:
-            # Highlight the current line with a blue background
-            print(f"{BG_BLUE}{line_str}{RESET}")
-        else:
-            print(line_str)
-    
+    return (f"{CHECKBOX_UNSELECTED} {WHITE}{file}{RESET}",
+            f"{CHECKBOX_SELECTED} {WHITE}{file}{RESET}",
+            f"{CHECKBOX_MERGED} {MAGENTA}{file}{RESET}")
+
+def pick_file_row(variants, file, selected_files, merged_files):
+    """Choose the precomputed row matching a file's current state."""
+    unselected, selected, merged = variants
+    if file in merged_files:
+        return merged
+    return selected if file in selected_files else unselected
+
+def highlight_row(row):
+    # Highlight the current line with a blue background
+    return f"{BG_BLUE}{row}{RESET}"
+
+def selected_count_line(selected_count):
     # Show the count of selected files in bold yellow
-    print(f"\n{BOLD}{YELLOW}Selected files:{RESET}", len([f for f in selected_files if f not in merged_files]))
+    return f"{BOLD}{YELLOW}Selected files:{RESET} {selected_count}"
+
+def print_file_list(rows, selected_count, current_index):
+    """Print the pre-rendered file rows and highlight the current selection.
+       The whole frame is built first and written to the terminal at once.
+    """
+    # Clear the screen, then the instructions in bold blue
+    lines = [CLEAR_SCREEN + SELECTION_HEADER]
+    lines.extend(rows)
+    lines[current_index + 1] = highlight_row(rows[current_index])
+
+    lines.append("\n" + selected_count_line(selected_count))
     # Instructions for other keys
-    print(f"\nPress '{RED}q{RESET}' to quit, '{GREEN}a{RESET}' to select all non-merged, '{RED}d{RESET}' to deselect all")
+    lines.append(SELECTION_KEYS_HELP)
+
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.flush()
+
+@lru_cache(maxsize=None)
+def display_width(text):
+    """Terminal columns taken by text. Wide and fullwidth characters take two;
+       ambiguous ones (like the arrows in the title) are counted as two as well,
+       since some terminals draw them that way.
+    """
+    return sum(2 if unicodedata.east_asian_width(ch) in "WFA" else 1 for ch in text)
+
+def file_list_fits_screen(files):
+    """Whether the selection screen fits the terminal with no line wrapping or
+       scrolling, so that screen lines map one-to-one onto file rows.
+    """
+    columns, lines = shutil.get_terminal_size()
+    widest_row = len("[x] ") + max(display_width(f) for f in files)
+    return (max(widest_row, display_width(SELECTION_TITLE)) < columns
+            and len(files) + SELECTION_SCREEN_EXTRA_LINES <= lines)
+
+def redraw_file_rows(rows, selected_count, current_index, indexes):
+    """Rewrite only the given rows and the selected count in place,
+       leaving the cursor where a full redraw would.
+    """
+    out = []
+    for i in indexes:
+        row = highlight_row(rows[i]) if i == current_index else rows[i]
+        # Move to the row's line, clear it, and write the new text
+        out.append(f"\033[{FIRST_FILE_ROW + i};1H\033[2K{row}")
+    count_row = FIRST_FILE_ROW + len(rows) + 1
+    out.append(f"\033[{count_row};1H\033[2K{selected_count_line(selected_count)}")
+    out.append(f"\033[{len(rows) + SELECTION_SCREEN_EXTRA_LINES};1H")
+    sys.stdout.write("".join(out))
+    sys.stdout.flush()
 
 def interactive_file_selection(files, merged_files):
     """
@@ -125,11 +237,27 @@ def interactive_file_selection(files, merged_files):
     Already merged files are shown differently and cannot be re-selected.
     Returns a list of selected files.
     """
+    # Merged files can never be toggled or bulk-selected, so selected_files
+    # stays disjoint from merged_files and its size is the selection count
     selected_files = set()
     current_index = 0
+    # Each file's row is formatted once per state up front; toggling only
+    # swaps which precomputed string is shown, and cursor moves change nothing
+    row_variants = [render_file_row_variants(f) for f in files]
+    rows = [pick_file_row(v, f, selected_files, merged_files) for v, f in zip(row_variants, files)]
+    # Only redraw after a key that changed the cursor or the selection. When
+    # the list fits the terminal, cursor moves and toggles rewrite just the
+    # affected rows; everything else repaints the whole screen.
+    full_redraw = True
+    changed_rows = set()
     
     while True:
-        print_file_list(files, selected_files, merged_files, current_index)
+        if changed_rows and not full_redraw and file_list_fits_screen(files):
+            redraw_file_rows(rows, len(selected_files), current_index, sorted(changed_rows))
+        elif changed_rows or full_redraw:
+            print_file_list(rows, len(selected_files), current_index)
+        full_redraw = False
+        changed_rows = set()
         
         try:
             key = msvcrt.getch()  # Get keypress without Enter
@@ -137,9 +265,13 @@ def interactive_file_selection(files, merged_files):
             if key == b'\xe0':  # Special key prefix
                 key = msvcrt.getch()  # Get the actual special key
                 if key == b'H':  # Up arrow
+                    changed_rows.add(current_index)
                     current_index = (current_index - 1) % len(files)
+                    changed_rows.add(current_index)
                 elif key == b'P':  # Down arrow
+                    changed_rows.add(current_index)
                     current_index = (current_index + 1) % len(files)
+                    changed_rows.add(current_index)
             elif key == b' ':  # Space
                 current_file = files[current_index]
                 if current_file in merged_files:
@@ -150,20 +282,25 @@ def interactive_file_selection(files, merged_files):
                         selected_files.remove(current_file)
                     else:
                         selected_files.add(current_file)
+                    rows[current_index] = pick_file_row(row_variants[current_index], current_file,
+                                                        selected_files, merged_files)
+                    changed_rows.add(current_index)
             elif key == b'\r':  # Enter
-                # Return only non-merged selected files
-                final_selection = [f for f in selected_files if f not in merged_files]
-                if final_selection:
-                    return final_selection
+                if selected_files:
+                    return list(selected_files)
             elif key == b'q':  # Quit
                 return None
             elif key == b'a':  # Select all non-merged
                 selected_files = set(f for f in files if f not in merged_files)
+                rows = [pick_file_row(v, f, selected_files, merged_files) for v, f in zip(row_variants, files)]
+                full_redraw = True
             elif key == b'd':  # Deselect all
                 selected_files.clear()
+                rows = [pick_file_row(v, f, selected_files, merged_files) for v, f in zip(row_variants, files)]
+                full_redraw = True
                 
         except Exception as e:
-            logging.error(f"Error during selection: {e}")
+            logging.error("Error during selection: %s", e)
             return None
 
 def select_files_to_merge(grouped_files):
@@ -171,13 +308,16 @@ def select_files_to_merge(grouped_files):
         logging.info("No MP3 files found with the expected date-time format.")
         return None
 
-    # Display available dates
-    dates = sorted(grouped_files.keys())
+    # Display available dates; grouped_files was built from a sorted list,
+    # so its keys are already in chronological order
+    dates = list(grouped_files)
     clear_screen()
-    print("\nAvailable dates:")
+    menu = ["\nAvailable dates:"]
     for i, date in enumerate(dates, 1):
-        print(f"{i}. {date.strftime('%Y-%m-%d')} ({len(grouped_files[date])} files)")
-        print(f"{i}a. Merge all files for {date.strftime('%Y-%m-%d')}")
+        label = date.isoformat()  # YYYY-MM-DD without going through strftime
+        menu.append(f"{i}. {label} ({len(grouped_files[date])} files)")
+        menu.append(f"{i}a. Merge all files for {label}")
+    print("\n".join(menu))
 
     # Select date
     while True:
@@ -192,8 +332,8 @@ def select_files_to_merge(grouped_files):
                     date_num = int(choice[:-1])
                     if 1 <= date_num <= len(dates):
                         selected_date = dates[date_num - 1]
-                        # Return all files for the selected date, sorted by time
-                        return selected_date, sorted(grouped_files[selected_date], key=parse_time_from_filename)
+                        # Return all (timestamp, filename) pairs for the selected date, already sorted by time
+                        return selected_date, list(grouped_files[selected_date])
                 except ValueError:
                     print("Invalid selection. Please try again.")
                     continue
@@ -209,7 +349,19 @@ def select_files_to_merge(grouped_files):
         except ValueError:
             print("Please enter a valid number or number+a (e.g., '1' or '1a').")
 
+# One pool serves every merge in a session instead of starting and joining
+# fresh threads each time; it is created on first use
+io_executor = None
+
+def get_io_executor():
+    global io_executor
+    if io_executor is None:
+        io_executor = ThreadPoolExecutor(max_workers=IO_WORKERS)
+    return io_executor
+
 def load_audio_clip(file_path):
+    from moviepy.editor import AudioFileClip
+
     try:
         clip = AudioFileClip(file_path)
         return clip
@@ -217,71 +369,222 @@ def load_audio_clip(file_path):
         logging.error("Error loading clip %s: %s", file_path, e)
         return None
 
-def process_files(date, files, output_dir):
-    # Sort the list based on time in the filename
-    files.sort(key=lambda x: parse_time_from_filename(x))
-    file_paths = [os.path.join(directory, f) for f in files]
+def load_probe_cache():
+    """Read saved probe results, keyed by 'path|mtime_ns|size'."""
+    if not PROBE_CACHE_FILE or not os.path.isfile(PROBE_CACHE_FILE):
+        return {}
+    try:
+        with open(PROBE_CACHE_FILE, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+    except Exception as e:
+        logging.warning("Failed to load probe cache: %s", e)
+        return {}
+    if not isinstance(saved, dict):
+        logging.warning("Ignoring probe cache %s: expected a JSON object", PROBE_CACHE_FILE)
+        return {}
+    return saved
+
+def save_probe_cache():
+    """Write the probe results back, dropping entries for files that are gone."""
+    kept = {key: probe for key, probe in saved_probes.items()
+            if os.path.exists(key.rsplit("|", 2)[0])}
+    # Write a temporary file and swap it in, so an interrupted save never
+    # leaves a truncated cache behind
+    tmp_path = PROBE_CACHE_FILE + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(kept, f)
+        os.replace(tmp_path, PROBE_CACHE_FILE)
+    except OSError as e:
+        logging.warning("Failed to save probe cache: %s", e)
+
+saved_probes = load_probe_cache()
+if PROBE_CACHE_FILE:
+    atexit.register(save_probe_cache)
+
+def probe_audio(file_path):
+    """Read the duration and audio stream parameters of a file with ffprobe.
+       Returns (duration, (codec, sample_rate, channels)), or None if the file
+       cannot be probed. Only the headers are read; nothing is decoded.
+    """
+    try:
+        st = os.stat(file_path)
+    except OSError as e:
+        logging.error("Error probing %s: %s", file_path, e)
+        return None
+    # Keyed on size and mtime so a file rewritten between merges is probed again
+    return probe_audio_cached(file_path, st.st_mtime_ns, st.st_size)
 
-    # Parallel loading with progress
-    audio_clips = []
-    with ThreadPoolExecutor() as executor:
-        # Map with progress bar
-        futures = list(tqdm(executor.map(load_audio_clip, file_paths), total=len(file_paths), desc="Loading Clips"))
-        for clip in futures:
-            if clip and clip.duration > 0:
-                audio_clips.append(clip)
-
-    if not audio_clips:
-        logging.warning(f"No valid audio clips found for {date}")
-        return False
+@lru_cache(maxsize=4096)
+def probe_audio_cached(file_path, mtime_ns, size):
+    key = f"{os.path.abspath(file_path)}|{mtime_ns}|{size}"
+    try:
+        duration, (codec, sample_rate, channels) = saved_probes[key]
+        return float(duration), (codec, sample_rate, channels)
+    except KeyError:
+        pass
+    except (TypeError, ValueError):
+        # A malformed entry is probed again and replaced below
+        pass
+    try:
+        result = subprocess.run(
+            [FFPROBE_PATH, "-v", "error", "-select_streams", "a:0",
+             "-show_entries", "format=duration:stream=codec_name,sample_rate,channels",
+             "-of", "json", file_path],
+            capture_output=True, text=True, errors="replace", check=True)
+        info = json.loads(result.stdout)
+        stream = info["streams"][0]
+        duration = float(info["format"]["duration"])
+        probe = duration, (stream.get("codec_name"), stream.get("sample_rate"), stream.get("channels"))
+        saved_probes[key] = probe
+        return probe
+    except (OSError, subprocess.CalledProcessError, ValueError, KeyError, IndexError, TypeError) as e:
+        logging.error("Error probing %s: %s", file_path, e)
+        return None
 
-    # Calculate total duration
-    total_duration = sum(clip.duration for clip in audio_clips if clip)
+def log_total_duration(total_duration):
     minutes = int(total_duration // 60)
     seconds = int(total_duration % 60)
-    logging.info(f"Total merged duration: {minutes} minutes and {seconds} seconds.")
+    logging.info("Total merged duration: %d minutes and %d seconds.", minutes, seconds)
+
+def concat_stream_copy(file_paths, output_path):
+    """Join MP3 files with ffmpeg's concat demuxer, copying the frames as-is.
+       Returns True on success, False if ffmpeg could not join the inputs.
+    """
+    list_fd, list_path = tempfile.mkstemp(suffix=".txt", text=True)
+    try:
+        with os.fdopen(list_fd, "w", encoding="utf-8") as list_file:
+            for file_path in file_paths:
+                # The concat list quotes paths with single quotes; escape any in the name
+                escaped = os.path.abspath(file_path).replace("'", "'\\''")
+                list_file.write(f"file '{escaped}'\n")
+        result = subprocess.run(
+            [FFMPEG_PATH, "-y", "-v", "error", "-f", "concat", "-safe", "0",
+             "-i", list_path, "-c", "copy", output_path],
+            capture_output=True, text=True, errors="replace")
+    except OSError as e:
+        logging.warning("Could not run ffmpeg: %s", e)
+        return False
+    finally:
+        os.remove(list_path)
 
-    # Get the first audio clip filename
-    first_clip_filename = files[0]
+    if result.returncode != 0:
+        logging.warning("Stream copy failed: %s", result.stderr.strip())
+        return False
+    return True
 
-    # Extract date and time from the first audio clip filename
-    first_clip_date, first_clip_time = parse_date_and_time_from_filename(first_clip_filename)
+def merge_with_ffmpeg(date, file_paths, output_path):
+    # Parallel probing with progress
+    executor = get_io_executor()
+    probes = list(tqdm(executor.map(probe_audio, file_paths), total=len(file_paths), desc="Probing Files"))
 
-    if first_clip_date is None or first_clip_time is None:
-        logging.error(f"Could not parse date and time from filename: {first_clip_filename}")
+    valid = [(path, probe) for path, probe in zip(file_paths, probes) if probe and probe[0] > 0]
+    if not valid:
+        logging.warning("No valid audio clips found for %s", date)
         return False
 
-    # Format the date and time for the output filename
-    output_filename = f"{first_clip_date.strftime('%Y%m%d')} {first_clip_time.strftime('%H-%M')}.mp3"
+    log_total_duration(sum(duration for _, (duration, _) in valid))
 
-    if output_dir:
-        output_path = os.path.join(output_dir, output_filename)
-    else:
-        output_path = os.path.join(directory, output_filename)
+    valid_paths = [path for path, _ in valid]
+    # The concat demuxer only produces a playable file when every input
+    # shares the same codec, sample rate and channel layout
+    stream_params = {params for _, (_, params) in valid}
+    if len(stream_params) == 1 and concat_stream_copy(valid_paths, output_path):
+        return True
 
-    logging.info(f"Merging files into: {output_filename}")
+    logging.info("Falling back to re-encoding with MoviePy.")
+    return merge_with_moviepy(date, valid_paths, output_path)
 
+def merge_with_moviepy(date, file_paths, output_path):
     try:
+        from moviepy.editor import concatenate_audioclips
+    except ImportError as e:
+        logging.error("Re-encoding needs MoviePy, which could not be imported: %s", e)
+        return False
+
+    # Parallel loading with progress
+    executor = get_io_executor()
+    loaded = [clip for clip in tqdm(executor.map(load_audio_clip, file_paths), total=len(file_paths), desc="Loading Clips") if clip]
+
+    # Every loaded clip holds an ffmpeg reader process, so close them all,
+    # including empty ones, however the merge ends
+    final_clip = None
+    try:
+        audio_clips = [clip for clip in loaded if clip.duration > 0]
+        if not audio_clips:
+            logging.warning("No valid audio clips found for %s", date)
+            return False
+
+        log_total_duration(sum(clip.duration for clip in audio_clips))
+
         final_clip = concatenate_audioclips(audio_clips)
-        final_clip.write_audiofile(output_path)
-        # Close all clips
-        for c in audio_clips:
-            c.close()
-        final_clip.close()
-        logging.info(f"Merge complete! Output saved as: {output_path}")
+        # Larger chunks mean fewer round trips between numpy and the ffmpeg pipe
+        final_clip.write_audiofile(output_path, buffersize=200000)
         return True
     except Exception as e:
         logging.error("Error during merging: %s", e)
         return False
+    finally:
+        for clip in loaded:
+            clip.close()
+        if final_clip:
+            final_clip.close()
 
-# Group files by date
-grouped_files = defaultdict(list)
+def process_files(date, files, output_dir):
+    """Merge files given as (timestamp, filename) pairs in chronological order."""
+    file_paths = [os.path.join(directory, f) for _, f in files]
+
+    # Name the output after the timestamp of the first clip
+    first_clip_timestamp = files[0][0]
+    output_filename = f"{first_clip_timestamp.strftime('%Y%m%d %H-%M')}.mp3"
+
+    if output_dir:
+        output_path = os.path.join(output_dir, output_filename)
+    else:
+        output_path = os.path.join(directory, output_filename)
+
+    logging.info("Merging files into: %s", output_filename)
+
+    # Stream-copy with ffmpeg when it is installed; MoviePy decodes and
+    # re-encodes every clip, which is far slower for same-format MP3s
+    if FFMPEG_AVAILABLE:
+        merged = merge_with_ffmpeg(date, file_paths, output_path)
+    else:
+        merged = merge_with_moviepy(date, file_paths, output_path)
+
+    if merged:
+        logging.info("Merge complete! Output saved as: %s", output_path)
+    return merged
+
+# Group files by date: parse each name once into a (timestamp, filename)
+# pair, sort once, then split into per-date lists that are already in
+# chronological order
+parsed_files = []
 for mp3_file in mp3_files:
-    date, _ = parse_date_and_time_from_filename(mp3_file)
+    date, time = parse_date_and_time_from_filename(mp3_file)
     if date is not None:
-        grouped_files[date].append(mp3_file)
+        parsed_files.append((datetime.combine(date, time), mp3_file))
+parsed_files.sort(key=itemgetter(0))
+
+grouped_files = {
+    date: list(group)
+    for date, group in groupby(parsed_files, key=lambda pair: pair[0].date())
+}
+
+def ask_next_step():
+    """Ask what to do after a merge: 's' (same date), 'n' (new date) or 'q' (quit)."""
+    while True:
+        choice = input("\nMerge more from the (s)ame date, choose a (n)ew date, or (q)uit? ").strip().lower()
+        if choice in ('s', 'n', 'q'):
+            return choice
+        print("Please enter 's', 'n' or 'q'.")
 
 def main():
+    if os.name == 'nt':
+        # Any os.system call switches legacy Windows consoles into ANSI
+        # escape mode; do it once here instead of spawning cls on every redraw
+        os.system('')
+
     logging.info("MP3 File Merger Started")
     print(f"{BOLD}{YELLOW}MP3 File Merger{RESET}")
     print("=" * 15)
@@ -298,12 +601,13 @@ def main():
         date, files = selection
         if files is not None:
             # "Merge all" choice was selected
-            success = process_files(date, files, OUTPUT_DIR)
-            if input("\nWould you like to merge more files? (y/n): ").lower() != 'y':
+            process_files(date, files, OUTPUT_DIR)
+            if input("\nWould you like to merge files from another date? (y/n): ").lower() != 'y':
                 break
         else:
             # Interactive selection on this date
-            day_files = sorted(grouped_files[date], key=parse_time_from_filename)
+            day_pairs = grouped_files[date]
+            day_files = [f for _, f in day_pairs]
             merged_files = set()  # keep track of all merged files for this date
 
             while True:
@@ -312,24 +616,26 @@ def main():
                     # No selection, ask user if they want to return to main menu
                     proceed = input("\nNo files selected. Return to main menu? (y/n): ").lower()
                     if proceed == 'y':
+                        next_step = 'n'
                         break
                     else:
                         continue
                 
-                success = process_files(date, selected_files, OUTPUT_DIR)
+                # Keep the chosen files in chronological order
+                chosen = set(selected_files)
+                selected_pairs = [pair for pair in day_pairs if pair[1] in chosen]
+                success = process_files(date, selected_pairs, OUTPUT_DIR)
                 if success:
                     # Mark selected files as merged
                     merged_files.update(selected_files)
 
-                # Ask if user wants to merge more files from the same day
-                more = input("\nWould you like to merge more files from the same day? (y/n): ").lower()
-                if more != 'y':
-                    # Exit to main menu
+                # A single prompt decides between the same day, another date, or quitting
+                next_step = ask_next_step()
+                if next_step != 's':
                     break
 
-        # After finishing with this date
-        if input("\nWould you like to merge files from another date? (y/n): ").lower() != 'y':
-            break
+            if next_step == 'q':
+                break
 
     logging.info("Thank you for using MP3 File Merger!")
     print(f"\n{BOLD}{GREEN}Thank you for using MP3 File Merger!{RESET}")
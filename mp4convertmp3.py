@@ -1,23 +1,76 @@
-from moviepy.editor import AudioFileClip
 import os
+import sys
+import shutil
+import subprocess
 import concurrent.futures
 
+# Each conversion drives its own ffmpeg encoder, so one worker per CPU keeps
+# every core busy without oversubscribing them.
+MAX_WORKERS = os.cpu_count() or 4
+
+# Call ffmpeg directly when it is on PATH; otherwise fall back to MoviePy,
+# which ships its own ffmpeg binary
+FFMPEG_PATH = shutil.which("ffmpeg")
+FFPROBE_PATH = shutil.which("ffprobe")
+
+def probe_audio_codec(video_file):
+    """Return the codec name of the first audio stream, or None if unknown."""
+    if not FFPROBE_PATH:
+        return None
+    result = subprocess.run(
+        [FFPROBE_PATH, "-v", "error", "-select_streams", "a:0",
+         "-show_entries", "stream=codec_name", "-of", "csv=p=0", video_file],
+        capture_output=True, text=True, errors="replace")
+    return result.stdout.strip() or None
+
 def convert_mp4_to_mp3(video_file):
     # Remove .mp4 from video_file string and add .mp3
     audio_file = os.path.splitext(video_file)[0] + '.mp3'
-    clip = AudioFileClip(video_file)
-    clip.write_audiofile(audio_file, codec='mp3')
+    if not FFMPEG_PATH:
+        from moviepy.editor import AudioFileClip
+        clip = AudioFileClip(video_file)
+        # One encoder thread per job; the pool already runs one job per CPU
+        clip.write_audiofile(audio_file, codec='mp3', ffmpeg_params=['-threads', '1'])
+        return
+
+    # An MP3 audio track can be copied out as-is; anything else is re-encoded
+    if probe_audio_codec(video_file) == "mp3":
+        codec_args = ['-c:a', 'copy']
+    else:
+        codec_args = ['-c:a', 'libmp3lame', '-threads', '1']
+    try:
+        subprocess.run([FFMPEG_PATH, '-y', '-v', 'error', '-i', video_file, '-vn',
+                        *codec_args, audio_file], check=True)
+    except subprocess.CalledProcessError:
+        # Don't leave a half-written MP3 behind
+        if os.path.exists(audio_file):
+            os.remove(audio_file)
+        raise
 
 def convert_all_mp4_in_directory():
-    # Get all files in the current directory
-    files = os.listdir()
+    # Get the .mp4 files in the current directory; directories with that
+    # suffix are left out rather than handed to ffmpeg
+    with os.scandir() as entries:
+        mp4_files = [e.name for e in entries if e.name.endswith('.mp4') and e.is_file()]
 
-    # Filter the list to only .mp4 files
-    mp4_files = [f for f in files if f.endswith('.mp4')]
+    if not mp4_files:
+        return
 
     # Use a ThreadPoolExecutor to convert multiple files at the same time
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        executor.map(convert_mp4_to_mp3, mp4_files)
+    workers = min(len(mp4_files), MAX_WORKERS)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        jobs = {executor.submit(convert_mp4_to_mp3, f): f for f in mp4_files}
+
+    # Report every failed conversion, then exit non-zero if there were any
+    failed = 0
+    for job, video_file in jobs.items():
+        try:
+            job.result()
+        except Exception as e:
+            print(f"Failed to convert {video_file}: {e}", file=sys.stderr)
+            failed += 1
+    if failed:
+        sys.exit(1)
 
 # Call the function to convert all .mp4 files in the current directory
 convert_all_mp4_in_directory()
\ No newline at end of file
@@ -2,41 +2,71 @@ import os
 import shutil
 import re
 import subprocess
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
 
-# Path to 7z.exe - adjust this to the correct path on your system
+# Path to 7z.exe - adjust this to the correct path on your system.
+# Leave empty to build the ZIPs in-process with Python's zipfile instead.
 path_to_7zip = ""
 
 # Get the current working directory
 working_directory = os.getcwd()
 
 # Regular expression to find the date and time
-date_time_pattern = re.compile(r'(\d{4})-(\d{2})-(\d{2}) (\d{2}-\d{2})')
+date_time_pattern = re.compile(r'(\d{4})-(\d{2})-(\d{2}) (\d{2}-\d{2})', re.ASCII)
 
-# Create a dictionary to store files by date
-files_by_date = defaultdict(list)
+# Get all mp3 files in the current directory. A folder whose name ends in
+# .mp3 is not a recording, so it stays where it is.
+with os.scandir() as entries:
+    mp3_files = [e.name for e in entries if e.name.endswith('.mp3') and e.is_file()]
 
-# Get all mp3 files in the current directory
-mp3_files = [f for f in os.listdir() if f.endswith('.mp3')]
-
-# Extract date and time and organize files by date
+# Extract date and time from each file once
+dated_files = []
 for file in mp3_files:
     match = date_time_pattern.search(file)
     if match:
         year, month, day, time = match.groups()
         formatted_date = f"{year}{month}{day}"  # Formatting the date as YYYYMMDD
-        files_by_date[formatted_date].append((time, file))
-
-# Sort files by date and time, move to corresponding folders, and ZIP them
-for date, files in files_by_date.items():
-    files.sort()  # Sort files by time
-    folder_name = f"{date} {files[0][0]}"
-    folder_path = os.path.join(working_directory, folder_name)
-    if not os.path.exists(folder_path):
-        os.makedirs(folder_path)
-    for _, file in files:
-        shutil.move(file, folder_path)
-
-    # Create ZIP using 7-Zip
-    zip_command = f"{path_to_7zip} a \"{folder_name}.zip\" \"{folder_path}\""  # Command to create a ZIP file
-    subprocess.run(zip_command, shell=True)  # Execute the ZIP command
\ No newline at end of file
+        dated_files.append((formatted_date, time, file))
+
+# Sort once by date and time, so each date's files come out grouped and in order
+dated_files.sort()
+
+def zip_folder(folder_name, folder_path):
+    if path_to_7zip:
+        # Create ZIP using 7-Zip
+        zip_command = f"{path_to_7zip} a \"{folder_name}.zip\" \"{folder_path}\""  # Command to create a ZIP file
+        subprocess.run(zip_command, shell=True)  # Execute the ZIP command
+    else:
+        # Same layout as 7-Zip: the folder itself at the root of the archive
+        shutil.make_archive(folder_name, 'zip', root_dir=working_directory, base_dir=folder_name)
+
+# Move each date's files to its folder, and ZIP them. Each folder is zipped in
+# the background as soon as its files are in place, while the next date's
+# files are being moved.
+with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
+    zip_jobs = []
+    for date, group in groupby(dated_files, key=itemgetter(0)):
+        files = [(time, file) for _, time, file in group]
+        folder_name = f"{date} {files[0][0]}"
+        folder_path = os.path.join(working_directory, folder_name)
+        if not os.path.exists(folder_path):
+            os.makedirs(folder_path)
+        # A plain rename is enough unless the folder sits on another filesystem
+        if os.stat(folder_path).st_dev == os.stat(working_directory).st_dev:
+            for _, file in files:
+                dest = os.path.join(folder_path, file)
+                # Refuse to overwrite, just as shutil.move does
+                if os.path.lexists(dest):
+                    raise shutil.Error(f"Destination path '{dest}' already exists")
+                os.rename(file, dest)
+        else:
+            for _, file in files:
+                shutil.move(file, folder_path)
+
+        zip_jobs.append(executor.submit(zip_folder, folder_name, folder_path))
+
+    # Re-raise any error from a ZIP job, as the sequential loop would have
+    for job in zip_jobs:
+        job.result()